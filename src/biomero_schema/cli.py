@@ -8,7 +8,7 @@ import jsonschema
 from rich.console import Console
 from rich.pretty import pprint
 
-from .models import WorkflowSchema
+from .models import WORKFLOW_ADAPTER, get_workflow_json_schema
 
 console = Console()
 
@@ -35,8 +35,8 @@ def cli():
 @cli.command()
 def schema():
     """Print JSON schema representation of pydantic model"""
-    model_schema = WorkflowSchema.model_json_schema()
-    console.print(json.dumps(model_schema, indent=2))
+    model_schema = get_workflow_json_schema()
+    click.echo(json.dumps(model_schema, indent=2))
 
 
 @cli.command()
@@ -46,7 +46,7 @@ def validate(json_file: str):
     console.print(f"[blue]Validating {json_file}...[/blue]")
     
     # Load schema and JSON file
-    schema = WorkflowSchema.model_json_schema()
+    schema = get_workflow_json_schema()
     data = load_json_file(json_file)
     
     try:
@@ -76,14 +76,14 @@ def parse(json_file: str, pretty: bool, output_json: bool):
     
     try:
         # Parse into Pydantic model
-        workflow = WorkflowSchema.model_validate(data)
+        workflow = WORKFLOW_ADAPTER.validate_python(data)
         
         console.print("[green]✓ Parsing successful![/green]")
         
         if output_json:
             # Output as JSON
-            json_output = workflow.model_dump_json(indent=2, by_alias=True)
-            console.print(json_output)
+            json_output = WORKFLOW_ADAPTER.dump_json(workflow, indent=2, by_alias=True).decode()
+            click.echo(json_output)
         elif pretty:
             # Pretty print the Pydantic object
             console.print("\n[bold]Parsed Workflow Object:[/bold]")
@@ -1,23 +1,151 @@
 """Pydantic models for the workflow schema."""
-from typing import List, Optional, Union, Literal
-from pydantic import BaseModel, Field
+from enum import Enum
+from functools import lru_cache
+from typing import Annotated, Any, Dict, List, Literal, Optional, Tuple, Union
+from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictFloat, StrictInt, StrictStr, StringConstraints, TypeAdapter, ValidationError, WithJsonSchema, model_validator
+from pydantic.json_schema import JsonSchemaMode
+
+
+class _StrEnum(str, Enum):
+    """String-valued enum that formats as its plain value."""
+    def __str__(self) -> str:
+        return self.value
+
+
+class ParameterType(_StrEnum):
+    """Data type of an input parameter.
+
+    The parameter models tag themselves with the plain string values, which
+    compare equal to these members.
+    """
+    NUMBER = "Number"
+    STRING = "String"
+    INTEGER = "integer"
+    FLOAT = "float"
+    BOOLEAN = "boolean"
+    STRING_LOWER = "string"
+    FILE = "file"
+    IMAGE = "image"
+    ARRAY = "array"
+
+
+class OutputType(_StrEnum):
+    """Data type of an output parameter."""
+    NUMBER = "Number"
+    STRING = "String"
+
+
+class ImageSubType(_StrEnum):
+    """Image parameter sub-type."""
+    GRAYSCALE = "grayscale"
+    COLOR = "color"
+    BINARY = "binary"
+    LABELED = "labeled"
+    CLASS = "class"
+
+
+class ImageFormat(_StrEnum):
+    """Image parameter file extension."""
+    TIF = "tif"
+    PNG = "png"
+    JPG = "jpg"
+    JPEG = "jpeg"
+    TIFF = "tiff"
+    OMETIFF = "ometiff"
+
+
+class ArrayFormat(_StrEnum):
+    """Array parameter file extension."""
+    NPY = "npy"
+    NPZ = "npz"
+
+
+class ContainerType(_StrEnum):
+    """Container runtime type."""
+    OCI = "oci"
+    SINGULARITY = "singularity"
+
+
+class ProblemClass(_StrEnum):
+    """BIAFlows problem class."""
+    OBJECT_SEGMENTATION = "object-segmentation"
+    PIXEL_CLASSIFICATION = "pixel-classification"
+    OBJECT_COUNTING = "object-counting"
+    OBJECT_DETECTION = "object-detection"
+    FILAMENT_TREE_TRACING = "filament-tree-tracing"
+    FILAMENT_NETWORKS_TRACING = "filament-networks-tracing"
+    LANDMARK_DETECTION = "landmark-detection"
+    PARTICLE_TRACKING = "particle-tracking"
+    OBJECT_TRACKING = "object-tracking"
+
+
+# Type tags handled by ScalarParameter.
+ScalarParameterType = Literal["Number", "String", "integer", "float", "boolean", "string"]
+
+# File extension, with or without the leading dot, possibly compound
+# (".csv", "csv", "nii.gz", ".ome.zarr").
+FileFormat = Annotated[str, StringConstraints(pattern=r"^\.?[A-Za-z0-9]+(?:\.[A-Za-z0-9]+)*$")]
+
+# Container image reference: optional registry host and port, a lower case
+# repository path, then an optional tag and/or sha256 digest.
+ImageName = Annotated[
+    str,
+    StringConstraints(
+        pattern=r"^(?:[a-z0-9.-]+(?::[0-9]+)?/)?[a-z0-9][a-z0-9._/-]*(?::[A-Za-z0-9_][A-Za-z0-9._-]{0,127})?(?:@sha256:[a-f0-9]{64})?$",
+        max_length=255,
+    ),
+]
+
+# Parameter default values are matched strictly, first member wins, so that
+# e.g. 1 stays an int and "true" stays a string.
+DefaultValue = Annotated[
+    Union[StrictBool, StrictInt, StrictFloat, StrictStr],
+    Field(union_mode="left_to_right"),
+]
+
+# A single CUDA compute capability is a minimum, a list enumerates the valid
+# values, so both shapes are kept. Each input shape matches at most one
+# member, so resolving left to right never retries the other branch.
+ComputeCapability = Annotated[Union[StrictStr, Tuple[StrictStr, ...]], Field(union_mode="left_to_right")]
+
+# Resources flag validated as a plain bool. Resources maps explicit nulls to
+# False before validation, so the JSON schema keeps null valid to match.
+CapabilityFlag = Annotated[bool, WithJsonSchema({"anyOf": [{"type": "boolean"}, {"type": "null"}]})]
+
+# Leaf models defer building their validators until first used directly;
+# validating a WorkflowSchema builds the nested schemas it needs itself.
+# Unknown keys are rejected on leaf models, so no extras dict is kept.
+# Leaves are frozen like WorkflowSchema, so a parsed tree is immutable and
+# hashable throughout.
+_LEAF_CONFIG = ConfigDict(defer_build=True, extra="forbid", frozen=True)
+
+# Type field shared by every parameter model; each subclass narrows the
+# annotation. Pydantic copies a FieldInfo default per field, so it is safe
+# to reuse.
+_PARAM_TYPE_FIELD = Field(..., description="Data type of the parameter")
 
 
 class Author(BaseModel):
     """Author model."""
+    model_config = _LEAF_CONFIG
+
     name: str = Field(..., description="Full name of author")
     email: Optional[str] = Field(None, description="Email address of author")
-    affiliations: Optional[List[str]] = Field(None, description="List of affiliations matching 'id' of an institution in institutions list")
+    affiliations: Optional[Tuple[str, ...]] = Field(None, description="List of affiliations matching 'id' of an institution in institutions list")
 
 
 class Institution(BaseModel):
     """Institution model."""
+    model_config = _LEAF_CONFIG
+
     id: str = Field(..., description="Unique institute identifier")
     name: Optional[str] = Field(None, description="Name of the institution. Defaults to id")
 
 
 class Citation(BaseModel):
     """Citation model."""
+    model_config = _LEAF_CONFIG
+
     name: str = Field(..., description="Name of the tool being cited")
     doi: Optional[str] = Field(None, description="DOI number of the tool being cited. Defaults to empty string")
     license: str = Field(..., description="License of the tool being cited")
@@ -26,106 +154,163 @@ class Citation(BaseModel):
 
 class ContainerImage(BaseModel):
     """Container image model."""
-    image: str = Field(..., description="Image to match the name of your workflow GitHub repository (lower case only)")
-    type: Literal["oci", "singularity"] = Field(..., description="Container type")
-    platforms: Optional[List[str]] = Field(None, description="Build-time multi-platform targets")
+    model_config = _LEAF_CONFIG
+
+    image: ImageName = Field(..., description="Image to match the name of your workflow GitHub repository (lower case only)")
+    type: ContainerType = Field(..., description="Container type")
+    platforms: Optional[Tuple[str, ...]] = Field(None, description="Build-time multi-platform targets")
 
 
 class CudaRequirements(BaseModel):
     """CUDA requirements model."""
+    model_config = _LEAF_CONFIG
+
     device_memory_min: Optional[float] = Field(None, alias="device-memory-min", description="Minimum device memory. Defaults to 0")
-    cuda_compute_capability: Optional[Union[str, List[str]]] = Field(None, alias="cuda-compute-capability", description="The cudaComputeCapability Schema; single min value or list of valid values. Defaults to None")
+    cuda_compute_capability: Optional[ComputeCapability] = Field(None, alias="cuda-compute-capability", description="The cudaComputeCapability Schema; single min value or list of valid values. Defaults to None")
+
+
+_RESOURCE_FLAGS = ("networking", "gpu", "cpuAVX", "cpuAVX2")
 
 
 class Resources(BaseModel):
     """Resources model."""
-    networking: Optional[bool] = Field(None, description="Whether internet connection is needed. Defaults to False")
+    model_config = _LEAF_CONFIG
+
+    networking: CapabilityFlag = Field(False, description="Whether internet connection is needed. Defaults to False")
     ram_min: Optional[float] = Field(None, alias="ram-min", description="Minimum RAM in mebibytes (Mi). Defaults to 0")
     cores_min: Optional[float] = Field(None, alias="cores-min", description="Minimum number of CPU cores. Defaults to 1")
-    gpu: Optional[bool] = Field(None, description="GPU/accelerator required. Defaults to False")
+    gpu: CapabilityFlag = Field(False, description="GPU/accelerator required. Defaults to False")
     cuda_requirements: Optional[CudaRequirements] = Field(None, alias="cuda-requirements")
-    cpuAVX: Optional[bool] = Field(None, description="Advanced Vector Extensions (AVX) CPU capability required. Defaults to False")
-    cpuAVX2: Optional[bool] = Field(None, description="Advanced Vector Extensions 2 (AVX2) CPU capability required. Defaults to False")
+    cpuAVX: CapabilityFlag = Field(False, description="Advanced Vector Extensions (AVX) CPU capability required. Defaults to False")
+    cpuAVX2: CapabilityFlag = Field(False, description="Advanced Vector Extensions 2 (AVX2) CPU capability required. Defaults to False")
+
+    @model_validator(mode="before")
+    @classmethod
+    def _null_flags_to_false(cls, data: Any) -> Any:
+        """Treat explicit nulls on the boolean capability flags as False."""
+        if isinstance(data, dict):
+            nulls = [flag for flag in _RESOURCE_FLAGS if flag in data and data[flag] is None]
+            if nulls:
+                data = {**data, **dict.fromkeys(nulls, False)}
+        return data
 
 
 class Configuration(BaseModel):
     """Configuration model."""
+    model_config = _LEAF_CONFIG
+
     input_folder: Optional[str] = Field(None, description="Full path where the input folder must be mounted in the container. Defaults to '/inputs'")
     output_folder: Optional[str] = Field(None, description="Full path where the output folder must be mounted in the container. Defaults to '/outputs'")
     resources: Optional[Resources] = Field(None)
 
 
-class FileParameter(BaseModel):
-    """File parameter specific fields."""
-    format: str = Field(..., description="Extension of the file type (.csv)")
-
-
-class ImageParameter(BaseModel):
-    """Image parameter specific fields."""
-    sub_type: Literal["grayscale", "color", "binary", "labeled", "class"] = Field(..., alias="sub-type", description="Image type")
-    format: Literal["tif", "png", "jpg", "jpeg", "tiff", "ometiff"] = Field(..., description="Extension of the image type")
-
+class _ParameterCommon(BaseModel):
+    """Fields shared by input and output parameters."""
+    model_config = _LEAF_CONFIG
 
-class ArrayParameter(BaseModel):
-    """Array parameter specific fields."""
-    format: Literal["npy", "npz"] = Field(..., description="Extension of the file type")
-
-
-class Parameter(BaseModel):
-    """Parameter model."""
     id: str = Field(..., description="Unique parameter identifier")
-    type: Literal["Number", "String", "integer", "float", "boolean", "string", "file", "image", "array"] = Field(..., description="Data type of the parameter")
+    type: str = _PARAM_TYPE_FIELD
     name: Optional[str] = Field(None, description="Human-readable display name appearing in BIAFLOWS UI (parameter dialog box). Defaults to '@id'")
     description: Optional[str] = Field(None, description="Description of parameter. Context help in BIAFLOWS UI (parameter dialog box). Soft Defaults to ''")
     value_key: Optional[str] = Field(None, alias="value-key", description="Substitution key in CLI. Defaults to '[@ID]'")
     command_line_flag: Optional[str] = Field(None, alias="command-line-flag", description="CLI flag. Defaults to '--@id'")
-    default_value: Optional[Union[str, float, bool]] = Field(None, alias="default-value", description="Default value in BIAFLOWS UI (parameter dialog box). Soft Defaults to empty string")
+    default_value: Optional[DefaultValue] = Field(None, alias="default-value", description="Default value in BIAFLOWS UI (parameter dialog box). Soft Defaults to empty string")
     optional: Optional[bool] = Field(None, description="If true, parameter not required. Soft Defaults to False")
     set_by_server: Optional[bool] = Field(None, alias="set-by-server", description="If true, parameter is server-assigned. Soft Defaults to False")
-    
-    # Type-specific fields
-    format: Optional[str] = Field(None, description="Format for file/image/array types")
-    sub_type: Optional[str] = Field(None, alias="sub-type", description="Sub-type for image parameters")
 
 
-class OutputParameter(BaseModel):
+class ScalarParameter(_ParameterCommon):
+    """Number, string or boolean parameter."""
+    type: ScalarParameterType = _PARAM_TYPE_FIELD
+
+
+class FileParameter(_ParameterCommon):
+    """File parameter."""
+    type: Literal["file"] = _PARAM_TYPE_FIELD
+    format: FileFormat = Field(..., description="Extension of the file type (.csv)")
+
+
+class ImageParameter(_ParameterCommon):
+    """Image parameter."""
+    type: Literal["image"] = _PARAM_TYPE_FIELD
+    sub_type: ImageSubType = Field(..., alias="sub-type", description="Image type")
+    format: ImageFormat = Field(..., description="Extension of the image type")
+
+
+class ArrayParameter(_ParameterCommon):
+    """Array parameter."""
+    type: Literal["array"] = _PARAM_TYPE_FIELD
+    format: ArrayFormat = Field(..., description="Extension of the file type")
+
+
+Parameter = Annotated[
+    Union[ScalarParameter, FileParameter, ImageParameter, ArrayParameter],
+    Field(discriminator="type"),
+]
+"""Input parameter, dispatched on its ``type`` tag."""
+
+
+class OutputParameter(_ParameterCommon):
     """Output parameter model."""
-    id: str = Field(..., description="Unique parameter identifier")
-    type: Literal["Number", "String"] = Field(..., description="Data type of the parameter")
-    name: Optional[str] = Field(None, description="Human-readable display name appearing in BIAFLOWS UI (parameter dialog box). Defaults to '@id'")
-    description: Optional[str] = Field(None, description="Description of parameter. Context help in BIAFLOWS UI (parameter dialog box). Soft Defaults to ''")
-    value_key: Optional[str] = Field(None, alias="value-key", description="Substitution key in CLI. Defaults to '[@ID]'")
-    command_line_flag: Optional[str] = Field(None, alias="command-line-flag", description="CLI flag. Defaults to '--@id'")
-    default_value: Optional[Union[str, float, bool]] = Field(None, alias="default-value", description="Default value in BIAFLOWS UI (parameter dialog box). Soft Defaults to empty string")
-    optional: Optional[bool] = Field(None, description="If true, parameter not required. Soft Defaults to False")
-    set_by_server: Optional[bool] = Field(None, alias="set-by-server", description="If true, parameter is server-assigned. Soft Defaults to False")
+    type: OutputType = _PARAM_TYPE_FIELD
 
 
 class WorkflowSchema(BaseModel):
     """Main workflow schema model."""
+    model_config = ConfigDict(validate_by_alias=True, validate_by_name=False, frozen=True, extra="ignore")
+
     name: str = Field(..., description="GitHub workflow repository name (without prefix). E.g. NucleiTracking-ImageJ")
     description: str = Field(..., description="Description of workflow")
     schema_version: str = Field(..., alias="schema-version", description="Semver of schema version")
-    authors: List[Author] = Field([], description="Authors list")
-    institutions: List[Institution] = Field([], description="Institutions list")
-    citations: List[Citation] = Field([], min_length=1, description="List of citations for the tool. At least one required")
-    problem_class: Optional[Literal[
-        "object-segmentation",
-        "pixel-classification",
-        "object-counting",
-        "object-detection",
-        "filament-tree-tracing",
-        "filament-networks-tracing",
-        "landmark-detection",
-        "particle-tracking",
-        "object-tracking",
-    ]] = Field(None, alias="problem-class", description="BIAFlows problem class")
+    authors: Tuple[Author, ...] = Field((), description="Authors list")
+    institutions: Tuple[Institution, ...] = Field((), description="Institutions list")
+    citations: Annotated[Tuple[Citation, ...], Field(min_length=1, description="List of citations for the tool. At least one required")]
+    problem_class: Optional[ProblemClass] = Field(None, alias="problem-class", description="BIAFlows problem class")
     container_image: ContainerImage = Field(..., alias="container-image", description="Base container description")
     configuration: Optional[Configuration] = Field(None, description="Technical configuration")
-    inputs: List[Parameter] = Field(..., description="List of parameter descriptors")
-    outputs: List[OutputParameter] = Field([], description="List of output parameter descriptors")
+    inputs: Tuple[Parameter, ...] = Field(..., description="List of parameter descriptors")
+    outputs: Tuple[OutputParameter, ...] = Field((), description="List of output parameter descriptors")
     command_line: str = Field(..., alias="command-line", description="Command line template")
 
-    class Config:
-        populate_by_name = True
-        validate_by_name = True
+
+# Prebuilt adapter exposing the compiled WorkflowSchema validator and
+# serializer directly. Prefer WORKFLOW_ADAPTER.validate_json / validate_python
+# over the model classmethods on hot paths, and WORKFLOW_ADAPTER.dump_json as
+# the canonical serializer rather than json.dumps(workflow.model_dump()).
+WORKFLOW_ADAPTER: TypeAdapter[WorkflowSchema] = TypeAdapter(WorkflowSchema)
+WORKFLOW_LIST_ADAPTER: TypeAdapter[List[WorkflowSchema]] = TypeAdapter(List[WorkflowSchema])
+
+
+def batch_validate(blob: Union[str, bytes], allow_partial: bool = False) -> List[WorkflowSchema]:
+    """Validate a JSON array of workflows in a single pydantic-core pass.
+
+    With ``allow_partial``, ``blob`` may be a truncated stream: if the JSON
+    ends early, the workflows before the cut are returned and the element
+    at the cut is dropped. Complete JSON is always validated in full, so an
+    invalid workflow anywhere in it still raises.
+    """
+    try:
+        return WORKFLOW_LIST_ADAPTER.validate_json(blob)
+    except ValidationError as e:
+        if not (allow_partial and _is_truncated_json(e)):
+            raise
+    return WORKFLOW_LIST_ADAPTER.validate_json(blob, experimental_allow_partial=True)
+
+
+def _is_truncated_json(error: ValidationError) -> bool:
+    """Whether ``error`` is only the JSON parser hitting end of input."""
+    errors = error.errors(include_input=False, include_url=False)
+    return (
+        len(errors) == 1
+        and errors[0]["type"] == "json_invalid"
+        and errors[0].get("ctx", {}).get("error", "").startswith("EOF")
+    )
+
+
+@lru_cache(maxsize=None)
+def get_workflow_json_schema(mode: JsonSchemaMode = "validation") -> Dict[str, Any]:
+    """Return the WorkflowSchema JSON schema, generated once per mode.
+
+    The same dict is returned on every call; copy it before mutating.
+    """
+    return WorkflowSchema.model_json_schema(mode=mode)
@@ -0,0 +1,51 @@
+"""Tests for batch_validate."""
+import json
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from biomero_schema.models import batch_validate
+
+TESTS_DIR = Path(__file__).parent
+
+
+def _workflow(name):
+    return json.loads((TESTS_DIR / name).read_text())
+
+
+@pytest.fixture
+def good():
+    return _workflow("example_workflow.json")
+
+
+@pytest.fixture
+def bad(good):
+    workflow = dict(good)
+    del workflow["citations"]
+    return workflow
+
+
+@pytest.mark.parametrize("allow_partial", [False, True])
+def test_complete_blob_validates_every_workflow(good, allow_partial):
+    other = _workflow("W_NucleiSegmentation-ImageJ.descriptor.json")
+    workflows = batch_validate(json.dumps([good, other]), allow_partial=allow_partial)
+    assert [w.name for w in workflows] == [good["name"], other["name"]]
+
+
+@pytest.mark.parametrize("allow_partial", [False, True])
+def test_invalid_last_workflow_raises(good, bad, allow_partial):
+    with pytest.raises(ValidationError):
+        batch_validate(json.dumps([good, bad]), allow_partial=allow_partial)
+
+
+def test_truncated_blob_raises_without_allow_partial(good):
+    blob = json.dumps([good, good])[:-100]
+    with pytest.raises(ValidationError):
+        batch_validate(blob)
+
+
+def test_truncated_blob_drops_cut_workflow_with_allow_partial(good):
+    blob = json.dumps([good, good])[:-100]
+    workflows = batch_validate(blob.encode(), allow_partial=True)
+    assert [w.name for w in workflows] == [good["name"]]